@@ -1,4 +1,5 @@
 import os
+import shutil
 import tempfile
 from dotenv import load_dotenv
 import streamlit as st
@@ -10,11 +11,83 @@ TEAM_API_KEY = os.getenv("TEAM_API_KEY")
 if not TEAM_API_KEY:
     raise Exception("TEAM_API_KEY is not set in the environment.")
 
-# Import your BioLLM class (ensure model.py is in the same directory)
-from model import BioLLM
+# Temporary audio uploads go to RAM-backed tmpfs where available (Linux), so
+# saving a clip for speech recognition doesn't touch the disk
+SHM_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Import your BioLLM class (ensure biollm_model.py is in the same directory)
+from biollm_model import BioLLM
+
+# Streamlit reruns this script on every interaction, so build BioLLM once per
+# server process and share it (with its connection pool and caches) across
+# reruns and sessions
+@st.cache_resource
+def get_bio_llm(api_key: str) -> BioLLM:
+    return BioLLM(api_key=api_key)
+
+
+def compact_wav(path: str) -> None:
+    """Rewrite a multi-channel or high bit-depth WAV in place as mono 16-bit
+    PCM, shrinking the file uploaded for speech recognition. Compressed
+    formats are left alone since decoding them to WAV would grow the upload.
+    Any file libsndfile can't handle is left untouched for speech recognition."""
+    compact_path = path + ".compact"
+    try:
+        info = sf.info(path)
+        # WAVEX (WAVE_FORMAT_EXTENSIBLE) is the usual container for
+        # multichannel and 24/32-bit audio
+        if info.format not in ("WAV", "WAVEX") or (info.channels == 1 and info.subtype == "PCM_16"):
+            return
+        # Downmix block by block so the whole clip is never held in memory.
+        # Samples are read as float (integer reads don't rescale FLOAT/DOUBLE
+        # WAVs) and scaled to 16-bit on write; clip, since float WAVs may
+        # exceed full scale. Write beside the upload and swap in, so a failed
+        # write can't leave a truncated file behind
+        with sf.SoundFile(compact_path, "w", samplerate=info.samplerate, channels=1,
+                          format="WAV", subtype="PCM_16") as out:
+            for block in sf.blocks(path, blocksize=1 << 16, dtype="float32", always_2d=True):
+                out.write(block.mean(axis=1).clip(-1.0, 1.0))
+        os.replace(compact_path, path)
+    except (RuntimeError, OSError):
+        if os.path.exists(compact_path):
+            os.remove(compact_path)
+
+
+def save_upload(upload) -> str:
+    """Stream an upload into a temporary file in 1 MiB chunks, keeping its
+    extension so the format isn't mislabelled, and return the file's path.
+    tmpfs is used only when it has room for the upload and compact_wav's
+    rewrite (containers often cap /dev/shm at 64 MB); otherwise, or if it
+    fills up mid-copy, the default temp directory is used."""
+    suffix = os.path.splitext(upload.name)[1] or ".wav"
+    candidates = [None]
+    if SHM_DIR is not None:
+        try:
+            if shutil.disk_usage(SHM_DIR).free >= 2 * upload.size:
+                candidates.insert(0, SHM_DIR)
+        except OSError:
+            pass
+
+    for directory in candidates:
+        upload.seek(0)
+        with tempfile.NamedTemporaryFile(suffix=suffix, dir=directory, delete=False) as tmp:
+            try:
+                shutil.copyfileobj(upload, tmp, length=1 << 20)
+            except OSError:
+                if directory is None:
+                    # Last resort failed too; don't leave the partial copy behind
+                    try:
+                        tmp.close()
+                    finally:
+                        os.remove(tmp.name)
+                    raise
+            else:
+                return tmp.name
+        os.remove(tmp.name)
+
 
 # Initialize BioLLM instance
-bio_llm = BioLLM(api_key=TEAM_API_KEY)
+bio_llm = get_bio_llm(TEAM_API_KEY)
 
 # Streamlit app title and description
 st.title("BioLLM Text & Audio Processing")
@@ -73,29 +146,35 @@ elif mode == "Audio":
             st.error("Please upload an audio file.")
         else:
             with st.spinner("Processing audio..."):
-                # Save the uploaded audio to a temporary .wav file
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                    tmp_filename = tmp.name
-                    tmp.write(audio_file.read())
-                
-                # Process the audio using the BioLLM pipeline in speech mode
-                result = bio_llm.process_pipeline(
-                    input_type="audio",
-                    audio_path=tmp_filename,
-                    source_language=source_language,
-                    target_language="en",
-                    rag_query=rag_query,
-                    rag_category=rag_category
-                )
+                # Save the uploaded audio to a temporary file
+                tmp_filename = save_upload(audio_file)
                 
+                try:
+                    compact_wav(tmp_filename)
+
+                    # Process the audio using the BioLLM pipeline in speech mode,
+                    # showing the transcript as soon as speech recognition finishes
+                    result = {}
+                    for event in bio_llm.process_pipeline_stream(
+                        input_type="audio",
+                        audio_path=tmp_filename,
+                        source_language=source_language,
+                        target_language="en",
+                        rag_query=rag_query,
+                        rag_category=rag_category
+                    ):
+                        if event["step"] == "input_processing":
+                            st.subheader("Transcript")
+                            st.text_area("", event["data"].get("text", ""), height=150)
+                        elif event["step"] == "done":
+                            result = event["data"]
+                finally:
+                    # Remove the temporary file even if processing fails
+                    os.remove(tmp_filename)
                 
-                # Extract the transcript and the BioLLM result from the processing steps
-                transcript = result.get("steps", {}).get("input_processing", {}).get("text", "")
+                # Extract the BioLLM result from the processing steps
                 bio_llm_result = result.get("steps", {}).get("bio_llm_processing", {}).get("result", "")
                 
-                # Remove the temporary file
-                os.remove(tmp_filename)
-                
                 # If the source language is not English, translate the BioLLM result back
                 if source_language.lower() != "en":
                     translated = bio_llm.translate_text(
@@ -107,7 +186,5 @@ elif mode == "Audio":
                     response_text = bio_llm_result
                 
                 st.success("Audio processing complete!")
-                st.subheader("Transcript")
-                st.text_area("", transcript, height=150)
                 st.subheader("Response")
                 st.text_area("", response_text, height=200)
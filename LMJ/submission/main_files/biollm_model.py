@@ -0,0 +1,847 @@
+import os
+import copy
+import functools
+import hashlib
+import re
+import threading
+import time
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from aixplain.factories import ModelFactory
+from typing import Callable, Dict, Any, Hashable, Iterator, List, Optional
+import logging
+
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO,
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_LOGGER = logging.getLogger(__name__)
+
+# Default for single-lookup getattr probes of SDK results
+_MISSING = object()
+
+
+def _run_succeeded(result: Any, data: Any) -> bool:
+    """Whether an SDK run produced usable output. aixplain reports failures
+    (e.g. timeouts while a model warms up) as a response with a FAILED
+    status and empty data rather than raising."""
+    status = getattr(result, "status", None)
+    if status is not None and str(getattr(status, "value", status)).upper() != "SUCCESS":
+        return False
+    return data is not _MISSING and data not in (None, "")
+
+
+# Serializes first-time model fetches across all BioLLM instances
+_MODEL_LOCK = threading.Lock()
+
+
+def _normalize_text(text: str) -> str:
+    """Collapse runs of whitespace so trivially different inputs share a cache key"""
+    return " ".join(text.split())
+
+
+def _normalize_spacing(text: str) -> str:
+    """Collapse runs of spaces and tabs but keep line breaks, which carry
+    paragraph and list structure in multi-line text"""
+    return re.sub(r"[ \t]+", " ", text).strip()
+
+
+def _normalize_query(query: str) -> str:
+    """Lower-case a search query, collapse its whitespace and drop trailing
+    sentence punctuation. Other symbols are kept: "A+" vs "A-" or "> 7" vs
+    "< 7" are different medical questions."""
+    return _normalize_text(query.lower()).rstrip("?.! ")
+
+
+@functools.lru_cache(maxsize=32)
+def _fetch_model(model_id: str) -> Any:
+    """Fetch an aixplain model once per process; later calls reuse it"""
+    return ModelFactory.get(model_id)
+
+
+class _LRUCache:
+    """Thread-safe bounded mapping that evicts the least recently used entry,
+    optionally expiring entries older than ttl seconds"""
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            if key not in self._data:
+                return None
+            inserted_at, value = self._data[key]
+            if self.ttl is not None and time.monotonic() - inserted_at > self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard_if(self, predicate: Callable[[Hashable], bool]) -> None:
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class _SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers with the
+    same key wait for and share that call's result"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def run(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            owner = future is None
+            if owner:
+                future = self._calls[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class BioLLM:
+    """
+    Biomedical processing system with dual-mode RAG support:
+    - Automatic query generation from input
+    - Manual query specification
+    """
+
+    # System prompt sent verbatim on every BioLLM call; keeping it
+    # byte-identical lets the serving side reuse its cached prefix
+    _DEFAULT_CONTEXT = (
+        "You are an expert and experienced from the healthcare and biomedical domain with extensive "
+        "medical knowledge and practical experience. Your name is OpenBioLLM, and you were developed "
+        "by Saama AI Labs. who's willing to help answer the user's query with explanation. In your "
+        "explanation, leverage your deep medical expertise such as relevant anatomical structures, "
+        "physiological processes, diagnostic criteria, treatment guidelines, or other pertinent medical "
+        "concepts. Use precise medical terminology while still aiming to make the explanation clear "
+        "and accessible to a general audience."
+    )
+
+    _SAMPLING_PARAMS = ("temperature", "top_p", "top_k", "max_tokens")
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrent_pipelines: int = 50,
+        admission_timeout: float = 30.0
+    ):
+        """
+        Args:
+            api_key: aixplain team API key, else read from TEAM_API_KEY
+            max_concurrent_pipelines: Pipelines allowed in flight at once;
+                further calls wait up to admission_timeout seconds, then
+                fail fast with an error response
+        """
+        if api_key:
+            os.environ["TEAM_API_KEY"] = api_key
+        elif "TEAM_API_KEY" not in os.environ:
+            raise ValueError("API key required as argument or environment variable")
+        
+        self.logger = _LOGGER
+        
+        # Model IDs
+        self.bio_llm_id = "67ddc4b1181c58b7238eb33e"#"677c18696eb5634c19191911"
+        self.translate_id = "66a7e086f12784226d54d4a7"
+        self.speech_recognition_id = "6610617ff1278441b6482530"
+        
+        # Keep-alive session for direct API calls, reused across requests
+        self._http = requests.Session()
+        self._http.headers.update({
+            "x-api-key": os.environ["TEAM_API_KEY"],
+            "Content-Type": "application/json"
+        })
+        self._http.mount("https://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                backoff_jitter=0.2,
+                backoff_max=4,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=frozenset(["POST"])
+            )
+        ))
+
+        # Default BioLLM payload, pre-stringified once and copied per call
+        self._default_payload_tpl = {
+            "temperature": "1.0",
+            "top_p": "0.9",
+            "top_k": "50",
+            "max_tokens": "100",
+            "context": self._DEFAULT_CONTEXT
+        }
+
+        # Exact-match cache of deterministic (low temperature) BioLLM responses
+        self._response_cache = _LRUCache(maxsize=1024)
+
+        # Translations keyed by (source, target, text hash); intake phrasings repeat
+        self._translation_cache = _LRUCache(maxsize=1024)
+        self._translation_flights = _SingleFlight()
+
+        # Retrieval results keyed by (category, normalized query hash)
+        self._rag_cache = _LRUCache(maxsize=512, ttl=3600)
+        self._rag_cache_stats = {"hits": 0, "misses": 0}
+        self._rag_stats_lock = threading.Lock()
+        self._rag_flights = _SingleFlight()
+
+        # Admission control, so bursts queue briefly instead of piling up
+        # 30s upstream calls
+        self._admission = threading.BoundedSemaphore(max_concurrent_pipelines)
+        self._admission_timeout = admission_timeout
+
+        # Worker pool for overlapping independent network-bound stages; one
+        # worker per admitted pipeline so early RAG searches never queue
+        # behind each other (threads are only started as needed)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_pipelines,
+            thread_name_prefix="biollm"
+        )
+
+        # aixplain model handles, fetched on first use (or by warmup)
+        self._models: Dict[str, Any] = {}
+
+    @property
+    def bio_llm(self) -> Any:
+        return self._get_model(self.bio_llm_id)
+
+    @property
+    def translator(self) -> Any:
+        return self._get_model(self.translate_id)
+
+    @property
+    def speech_recognizer(self) -> Any:
+        return self._get_model(self.speech_recognition_id)
+
+    def _get_model(self, model_id: str) -> Any:
+        """Return the model for model_id, fetching it on first access"""
+        model = self._models.get(model_id)
+        if model is not None:
+            return model
+        with _MODEL_LOCK:
+            try:
+                model = _fetch_model(model_id)
+            except Exception as e:
+                self.logger.error("Model initialization failed: %s", e)
+                raise RuntimeError("Model initialization error") from e
+        self._models[model_id] = model
+        return model
+
+    def warmup(self) -> None:
+        """Fetch all models up front, concurrently"""
+        model_ids = [
+            model_id
+            for model_id in (self.bio_llm_id, self.translate_id, self.speech_recognition_id)
+            if model_id not in self._models
+        ]
+        try:
+            with ThreadPoolExecutor(max_workers=len(model_ids) or 1) as pool:
+                fetched = list(pool.map(_fetch_model, model_ids))
+        except Exception as e:
+            self.logger.error("Model initialization failed: %s", e)
+            raise RuntimeError("Model initialization error") from e
+
+        self._models.update(zip(model_ids, fetched))
+        self.logger.info("All models initialized successfully")
+
+    def process_pipeline(
+        self,
+        input_type: str = "text",
+        text: Optional[str] = None,
+        source_language: Optional[str] = None,
+        audio_path: Optional[str] = None,
+        rag_query: Optional[str] = None,
+        rag_category: Optional[str] = None,
+        target_language: str = "en",
+        bio_llm_params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Main processing pipeline with dual RAG modes
+        Args:
+            rag_query: Optional explicit search query
+            rag_category: Required category filter for RAG
+            bio_llm_params: Sampling params and optional context; set
+                "cache": True to reuse responses at any temperature
+        """
+        for event in self.process_pipeline_stream(
+            input_type=input_type,
+            text=text,
+            source_language=source_language,
+            audio_path=audio_path,
+            rag_query=rag_query,
+            rag_category=rag_category,
+            target_language=target_language,
+            bio_llm_params=bio_llm_params
+        ):
+            pass
+        return event["data"]
+
+    def process_pipeline_stream(
+        self,
+        input_type: str = "text",
+        text: Optional[str] = None,
+        source_language: Optional[str] = None,
+        audio_path: Optional[str] = None,
+        rag_query: Optional[str] = None,
+        rag_category: Optional[str] = None,
+        target_language: str = "en",
+        bio_llm_params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Run the pipeline, yielding each step as soon as it completes.
+        The admission slot is held from the first step until the stream
+        finishes, including while suspended at a yield, so callers must
+        consume the stream fully or close() it to free the slot.
+        Yields:
+            {"step": name, "data": step_result} per stage, then
+            {"step": "done", "data": response} with the full pipeline response
+        """
+        response = {
+            "status": "processing",
+            "steps": {},
+            "errors": []
+        }
+
+        admitted = False
+        try:
+            admitted = self._admission.acquire(timeout=self._admission_timeout)
+            if not admitted:
+                raise RuntimeError("Too many concurrent requests, try again shortly")
+
+            # Input validation
+            # "speech" is accepted as an alias for "audio"
+            if input_type not in ["text", "audio", "speech"]:
+                raise ValueError("Invalid input_type. Use 'text' or 'audio'")
+
+            # An explicit RAG query does not depend on the input, so start the
+            # search now and let it overlap with input processing and translation
+            rag_future = None
+            if rag_category and rag_query:
+                rag_future = self._executor.submit(
+                    self._handle_rag,
+                    query=rag_query,
+                    category=rag_category
+                )
+
+            # Process input
+            input_data = self._process_input(
+                input_type=input_type,
+                text=text,
+                audio_path=audio_path,
+                source_language=source_language
+            )
+            response["steps"]["input_processing"] = input_data
+            yield {"step": "input_processing", "data": input_data}
+            
+            if input_data["status"] != "success":
+                raise ValueError("Input processing failed")
+
+            # Translation, skipped outright in the common same-language case
+            if self._same_language(input_data.get("source_language"), target_language):
+                translated = {
+                    "translated_text": input_data.get("text", ""),
+                    "status": "skipped",
+                    "message": "No translation needed"
+                }
+            else:
+                translated = self._handle_translation(
+                    input_data=input_data,
+                    target_language=target_language
+                )
+            response["steps"]["translation"] = translated
+            yield {"step": "translation", "data": translated}
+            
+            # RAG processing
+            rag_data = None
+            if rag_future is not None:
+                rag_data = rag_future.result()
+            elif rag_category:
+                rag_data = self._handle_rag(
+                    query=translated["translated_text"],
+                    category=rag_category
+                )
+            if rag_data is not None:
+                response["steps"]["rag_processing"] = rag_data
+                yield {"step": "rag_processing", "data": rag_data}
+
+            # BioLLM processing
+            final_result = self._process_with_biollm(
+                translated_text=translated["translated_text"],
+                rag_data=rag_data,
+                params=bio_llm_params or {}
+            )
+            response["steps"]["bio_llm_processing"] = final_result
+            yield {"step": "bio_llm_processing", "data": final_result}
+
+            response.update({
+                "status": "success",
+                "final_result": final_result["result"],
+                "translated_text": translated["translated_text"],
+                "rag_data": rag_data["rag_result"] if rag_data else None
+            })
+
+        except Exception as e:
+            self.logger.error("Pipeline failed: %s", e)
+            response.update({
+                "status": "error",
+                "message": str(e),
+                "errors": response.get("errors", []) + [str(e)]
+            })
+        finally:
+            if admitted:
+                self._admission.release()
+
+        yield {"step": "done", "data": response}
+
+    def process_pipeline_batch(
+        self,
+        inputs: List[Dict[str, Any]],
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the pipeline over many inputs concurrently
+        Args:
+            inputs: Keyword arguments for process_pipeline, one dict per input
+            max_concurrency: Upper bound on pipelines in flight at once
+        Returns:
+            Pipeline responses in the same order as inputs
+        """
+        # Identical inputs whose responses are reusable (see _is_cacheable) are
+        # run once and fanned back out by index; sampled inputs each get their
+        # own run so repeated prompts still yield independent samples
+        keys: List[Hashable] = [
+            orjson.dumps(kwargs, default=str, option=orjson.OPT_SORT_KEYS)
+            if self._is_cacheable(kwargs.get("bio_llm_params") or {})
+            else index
+            for index, kwargs in enumerate(inputs)
+        ]
+        unique: Dict[Hashable, Dict[str, Any]] = {}
+        for key, kwargs in zip(keys, inputs):
+            unique.setdefault(key, kwargs)
+
+        # A dedicated pool, so batch workers never wait on RAG futures queued
+        # behind themselves in self._executor
+        with ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="biollm-batch"
+        ) as pool:
+            results = dict(zip(
+                unique,
+                pool.map(lambda kwargs: self.process_pipeline(**kwargs), unique.values())
+            ))
+        return [copy.deepcopy(results[key]) for key in keys]
+
+    def transcribe_many(
+        self,
+        audio_paths: List[str],
+        source_language: Optional[str] = None,
+        max_concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Run speech recognition over many audio files concurrently
+        Args:
+            audio_paths: Audio files to transcribe
+            source_language: Fallback language when the model reports none
+            max_concurrency: Upper bound on recognitions in flight at once
+        Returns:
+            Input-processing results in the same order as audio_paths
+        """
+        with ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="biollm-asr"
+        ) as pool:
+            return list(pool.map(
+                lambda audio_path: self._process_audio(audio_path, source_language),
+                audio_paths
+            ))
+
+    def _process_input(
+        self,
+        input_type: str,
+        text: Optional[str],
+        audio_path: Optional[str],
+        source_language: Optional[str]
+    ) -> Dict[str, Any]:
+        """Process input with validation"""
+        if input_type == "text":
+            return self._process_text(text, source_language)
+        return self._process_audio(audio_path, source_language)
+
+    def _process_text(
+        self,
+        text: str,
+        source_language: str
+    ) -> Dict[str, Any]:
+        """Process text input"""
+        if not text:
+            raise ValueError("Text input requires 'text' parameter")
+        if not source_language:
+            raise ValueError("Source language required for text input")
+        
+        return {
+            "text": text,
+            "source_language": source_language,
+            "status": "success",
+            "message": "Text processed"
+        }
+
+    def _process_audio(
+        self,
+        audio_path: str,
+        source_language: Optional[str]
+    ) -> Dict[str, Any]:
+        """Process audio input with speech recognition"""
+        if not audio_path:
+            raise ValueError("Audio input requires 'audio_path'")
+        
+        try:
+            result = self.speech_recognizer.run({"source_audio": audio_path})
+            return self._parse_speech_result(result, source_language)
+        except Exception as e:
+            return {
+                "text": "",
+                "source_language": source_language or "en",
+                "status": "error",
+                "message": f"Speech recognition failed: {str(e)}"
+            }
+
+    def _parse_speech_result(
+        self,
+        result: Any,
+        fallback_lang: Optional[str]
+    ) -> Dict[str, Any]:
+        """Parse speech recognition result"""
+        try:
+            data = getattr(result, "data", _MISSING)
+            if data is not _MISSING:
+                text = data.get('text', '') if isinstance(data, dict) else str(data)
+                lang = data.get('language', fallback_lang) if isinstance(data, dict) else fallback_lang
+            else:
+                text = str(result)
+                lang = fallback_lang
+
+            return {
+                "text": text,
+                "source_language": lang or "en",
+                "status": "success",
+                "message": "Audio processed"
+            }
+        except Exception as e:
+            self.logger.error("Speech parse error: %s", e)
+            return {
+                "text": "",
+                "source_language": fallback_lang or "en",
+                "status": "error",
+                "message": f"Parse failed: {str(e)}"
+            }
+
+    def translate_text(
+        self,
+        input_data: Dict[str, Any],
+        target_language: str = "en"
+    ) -> Dict[str, Any]:
+        """
+        Translate input_data["text"] from input_data["source_language"]
+        Returns:
+            Dictionary with translated_text (the original text on failure)
+        """
+        return self._handle_translation(
+            input_data=input_data,
+            target_language=target_language
+        )
+
+    def _handle_translation(
+        self,
+        input_data: Dict[str, Any],
+        target_language: str
+    ) -> Dict[str, Any]:
+        """Handle translation process"""
+        source_lang = input_data.get("source_language", "en")
+        text = input_data.get("text", "")
+
+        if self._same_language(source_lang, target_language) or not text:
+            return {
+                "translated_text": text,
+                "status": "success",
+                "message": "No translation needed"
+            }
+
+        cache_key = (
+            source_lang,
+            target_language,
+            hashlib.sha1(_normalize_spacing(text).encode("utf-8")).hexdigest()
+        )
+        cached = self._translation_cache.get(cache_key)
+        if cached is not None:
+            return {**cached, "cache": "hit"}
+
+        # Batched inputs often share text across different RAG settings;
+        # translate each distinct text once even when requested concurrently
+        return self._translation_flights.run(
+            cache_key,
+            lambda: self._translate(text, source_lang, target_language, cache_key)
+        )
+
+    def _translate(
+        self,
+        text: str,
+        source_lang: str,
+        target_language: str,
+        cache_key: Hashable
+    ) -> Dict[str, Any]:
+        """Call the translation model, caching successful results"""
+        try:
+            result = self.translator.run({
+                "text": text,
+                "sourcelanguage": source_lang,
+                "targetlanguage": target_language
+            })
+            translated = getattr(result, "data", _MISSING)
+            if not _run_succeeded(result, translated):
+                # Keep the original text and leave the cache untouched, so a
+                # failed (e.g. warming-up) run is retried on the next call
+                self.logger.error("Translation error: %s", getattr(result, "status", "no data"))
+                return {
+                    "translated_text": text,
+                    "status": "error",
+                    "message": "Translation failed: model returned no output"
+                }
+
+            translation = {
+                "translated_text": translated,
+                "status": "success",
+                "message": "Translated successfully"
+            }
+            self._translation_cache.put(cache_key, translation)
+            return translation
+        except Exception as e:
+            self.logger.error("Translation error: %s", e)
+            return {
+                "translated_text": text,
+                "status": "error",
+                "message": f"Translation failed: {str(e)}"
+            }
+
+    @staticmethod
+    def _same_language(source_language: Optional[str], target_language: str) -> bool:
+        """Compare language codes, which users type in varying case ("EN" vs "en")"""
+        return (source_language or "").strip().lower() == target_language.strip().lower()
+
+    def _handle_rag(
+        self,
+        query: str,
+        category: str
+    ) -> Dict[str, Any]:
+        """Execute RAG search with query"""
+        if not query:
+            return {
+                "rag_result": "",
+                "status": "error",
+                "message": "Empty query"
+            }
+
+        cache_key = (category, hashlib.sha256(_normalize_query(query).encode("utf-8")).hexdigest())
+        cached = self._rag_cache.get(cache_key)
+        self._record_rag_lookup(hit=cached is not None)
+        if cached is not None:
+            return {**cached, "cache": "hit"}
+
+        def search() -> Dict[str, Any]:
+            rag_data = self._search_rag(query, category)
+            if rag_data["status"] == "success":
+                self._rag_cache.put(cache_key, rag_data)
+            return rag_data
+
+        # Concurrent lookups for the same key wait on the first one's request
+        # instead of each sending their own
+        return self._rag_flights.run(cache_key, search)
+
+    def _search_rag(
+        self,
+        query: str,
+        category: str
+    ) -> Dict[str, Any]:
+        """Send a search request to the RAG endpoint"""
+        try:
+            response = self._http.post(
+                "https://models.aixplain.com/api/v2/execute/67dee7599bd803001dba3ca8",
+                data=orjson.dumps({
+                    "action": "search",
+                    "data": query,
+                    "payload": {
+                        "filters": {
+                            "field": "meta.attributes.category",
+                            "operator": "==",
+                            "value": category
+                        }
+                    }
+                }),
+                timeout=(3.05, 30)
+            )
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+
+            if result.get("status") == "SUCCESS" and result.get("completed"):
+                return {
+                    "rag_result": result.get("data", ""),
+                    "status": "success"
+                }
+            
+            return {
+                "rag_result": "",
+                "status": "error",
+                "message": f"RAG failed: {result.get('status', 'UNKNOWN')}"
+            }
+
+        except Exception as e:
+            self.logger.error("RAG error: %s", e)
+            return {
+                "rag_result": "",
+                "status": "error",
+                "message": f"RAG request failed: {str(e)}"
+            }
+
+    def invalidate_rag_cache(self, category: Optional[str] = None) -> None:
+        """Drop cached RAG results for one category, or all when none is given"""
+        if category is None:
+            self._rag_cache.clear()
+        else:
+            self._rag_cache.discard_if(lambda key: key[0] == category)
+
+    def _record_rag_lookup(self, hit: bool) -> None:
+        """Count RAG cache lookups and periodically log the hit ratio"""
+        with self._rag_stats_lock:
+            self._rag_cache_stats["hits" if hit else "misses"] += 1
+            hits = self._rag_cache_stats["hits"]
+            total = hits + self._rag_cache_stats["misses"]
+        if total % 100 == 0 and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("RAG cache hit ratio: %.2f%% over %d lookups", 100 * hits / total, total)
+
+    def _process_with_biollm(
+        self,
+        translated_text: str,
+        rag_data: Optional[Dict[str, Any]],
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Generate final response with BioLLM
+
+        Pass the same context string across calls (or omit it) so the
+        system prefix stays identical and can be served from prefix cache.
+        """
+        try:
+            context = params.get("context", self._DEFAULT_CONTEXT)
+            combined_input = translated_text
+
+            # Retrieved context goes ahead of the query so the stable part of
+            # the prompt forms the longest possible shared prefix
+            if rag_data and rag_data.get("rag_result"):
+                combined_input = f"Medical Context: {rag_data['rag_result']}\n\n{translated_text}"
+
+            # Sampled outputs differ run to run, so only near-greedy calls are
+            # cached unless the caller opts in with params["cache"]
+            cache_key = None
+            if self._is_cacheable(params):
+                cache_key = self._response_cache_key(context, combined_input, params)
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    return {**cached, "cache": "hit"}
+
+            # %.100s truncates at format time, so nothing is sliced when DEBUG is off
+            self.logger.debug("Processing with BioLLM using text: %.100s...", combined_input)
+
+            payload = self._default_payload_tpl.copy()
+            for name in self._SAMPLING_PARAMS:
+                if name in params:
+                    value = params[name]
+                    payload[name] = value if isinstance(value, str) else str(value)
+            payload["context"] = context
+            payload["data"] = combined_input
+
+            result = self.bio_llm.run(payload)
+            data = getattr(result, "data", _MISSING)
+
+            if data is not _MISSING and not _run_succeeded(result, data):
+                # Report the failure instead of a blank answer, and leave the
+                # cache untouched so the next call retries the model
+                self.logger.error("BioLLM error: %s", getattr(result, "status", "no data"))
+                return {
+                    "result": None,
+                    "status": "error",
+                    "message": "BioLLM failed: model returned no output"
+                }
+
+            final_result = {
+                "result": str(result) if data is _MISSING else data,
+                "status": "success"
+            }
+            if cache_key is not None and _run_succeeded(result, data):
+                self._response_cache.put(cache_key, final_result)
+            return final_result
+        except Exception as e:
+            self.logger.error("BioLLM error: %s", e)
+            return {
+                "result": None,
+                "status": "error",
+                "message": f"BioLLM failed: {str(e)}"
+            }
+
+    @staticmethod
+    def _is_cacheable(params: Dict[str, Any]) -> bool:
+        """Whether a BioLLM response for these params may be reused: near-greedy
+        sampling, or an explicit params["cache"] opt-in. A temperature that
+        isn't a number is passed through to the model but never cached."""
+        if params.get("cache"):
+            return True
+        try:
+            return float(params.get("temperature", 1.0)) <= 0.1
+        except (TypeError, ValueError):
+            return False
+
+    def _response_cache_key(
+        self,
+        context: str,
+        combined_input: str,
+        params: Dict[str, Any]
+    ) -> str:
+        """Hash everything that determines a BioLLM response"""
+        digest = hashlib.sha256(
+            "\x00".join((self.bio_llm_id, context, combined_input, "")).encode("utf-8")
+        )
+        digest.update(orjson.dumps(
+            {k: v for k, v in params.items() if k not in ("context", "cache")},
+            default=str,
+            option=orjson.OPT_SORT_KEYS
+        ))
+        return digest.hexdigest()